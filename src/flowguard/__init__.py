@@ -2,16 +2,32 @@
 
 __version__ = "0.1.0"
 
-from .models import State, Workflow, Transition
-from .engine import StateMachine
-from .parser import WorkflowParser
-from .persistence import StateStore
-
 __all__ = [
     "State",
-    "Workflow", 
+    "Workflow",
     "Transition",
     "StateMachine",
     "WorkflowParser",
     "StateStore",
-]
\ No newline at end of file
+]
+
+# Lazy re-exports (PEP 562) so `import flowguard` doesn't pay for pydantic
+# and the full model stack until a symbol is actually used.
+_EXPORTS = {
+    "State": "flowguard.models",
+    "Workflow": "flowguard.models",
+    "Transition": "flowguard.models",
+    "StateMachine": "flowguard.engine",
+    "WorkflowParser": "flowguard.parser",
+    "StateStore": "flowguard.persistence",
+}
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
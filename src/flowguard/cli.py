@@ -4,40 +4,43 @@ import click
 import sys
 from pathlib import Path
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.syntax import Syntax
-from .parser import WorkflowParser
-from .engine import StateMachine
-from .persistence import StateStore
-from .exceptions import FlowGuardError
+from .exceptions import FlowGuardError, WorkflowNotFoundError
+
+# Heavier imports (rich widgets, the pydantic-backed models behind the
+# parser/engine/store) are deferred into the commands that use them so
+# `flowguard --help` and light commands start faster.
 
 console = Console()
 
 
-@click.group()
+@click.group(help="FlowGuard - Deterministic workflow enforcement for AI agents.")
 def cli():
     """FlowGuard - Deterministic workflow enforcement for AI agents."""
     pass
 
 
-@cli.command()
+@cli.command(help="Start a new workflow instance.")
 @click.argument('workflow_name')
 @click.argument('description', required=False)
 @click.option('--workflow-file', '-f', type=click.Path(exists=True), 
               help='Path to workflow YAML file')
 def start(workflow_name: str, description: str = None, workflow_file: str = None):
     """Start a new workflow instance."""
+    from rich.panel import Panel
+    from .parser import WorkflowParser
+    from .engine import StateMachine
+    from .persistence import StateStore
+
     try:
         # Load workflow
         if workflow_file:
             workflow = WorkflowParser.parse_file(workflow_file)
         else:
             # Look for workflow in standard location
-            workflow_path = Path("workflows") / f"{workflow_name}.yaml"
-            if not workflow_path.exists():
+            workflow_path = WorkflowParser.find_workflow_file(workflow_name)
+            if not workflow_path:
                 console.print(f"[red]Workflow '{workflow_name}' not found[/red]")
-                console.print(f"Looked in: {workflow_path}")
+                console.print(f"Looked in: {Path('workflows') / f'{workflow_name}.yaml'}")
                 sys.exit(1)
             workflow = WorkflowParser.parse_file(workflow_path)
         
@@ -68,11 +71,17 @@ def start(workflow_name: str, description: str = None, workflow_file: str = None
         sys.exit(1)
 
 
-@cli.command()
+@cli.command(help="Show current workflow status.")
 @click.option('--instance-id', '-i', help='Specific instance ID')
 @click.option('--workflow', '-w', help='Show status for specific workflow')
 def status(instance_id: str = None, workflow: str = None):
     """Show current workflow status."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from .parser import WorkflowParser
+    from .engine import StateMachine
+    from .persistence import StateStore
+
     try:
         store = StateStore()
         
@@ -91,8 +100,8 @@ def status(instance_id: str = None, workflow: str = None):
                 sys.exit(1)
             instances = [instance]
         else:
-            # Show all instances
-            instance_list = store.list_instances()
+            # Show all instances (max 10)
+            instance_list = store.list_instances(limit=10)
             if not instance_list:
                 console.print("[yellow]No active workflow instances[/yellow]")
                 return
@@ -104,7 +113,7 @@ def status(instance_id: str = None, workflow: str = None):
             table.add_column("Current State", style="yellow")
             table.add_column("Updated", style="magenta")
             
-            for info in instance_list[:10]:  # Show max 10
+            for info in instance_list:
                 table.add_row(
                     info["id"],
                     info["workflow_name"],
@@ -118,38 +127,45 @@ def status(instance_id: str = None, workflow: str = None):
         # Show detailed status for single instance
         for instance in instances:
             # Load the workflow
-            workflow_path = Path("workflows") / f"{instance.workflow_name}.yaml"
-            if workflow_path.exists():
-                workflow = WorkflowParser.parse_file(workflow_path)
-                sm = StateMachine(workflow, instance)
-                
-                console.print(Panel(
-                    f"Instance ID: {instance.id}\\n"
-                    f"Workflow: [bold]{instance.workflow_name}[/bold]\\n"
-                    f"Current state: [cyan]{sm.current_state.name}[/cyan]\\n"
-                    f"Available actions: {', '.join(sm.get_available_actions())}\\n"
-                    f"Updated: {instance.updated_at.strftime('%Y-%m-%d %H:%M:%S')}",
-                    title="Workflow Status",
-                    border_style="blue"
-                ))
-                
-                # Show context
-                context = sm.get_context_for_injection()
-                console.print("\\n[bold]Current Context:[/bold]")
-                console.print(Panel(context, border_style="green"))
+            try:
+                workflow = WorkflowParser.load_for_instance(instance)
+            except WorkflowNotFoundError:
+                continue
+
+            sm = StateMachine(workflow, instance)
+
+            console.print(Panel(
+                f"Instance ID: {instance.id}\\n"
+                f"Workflow: [bold]{instance.workflow_name}[/bold]\\n"
+                f"Current state: [cyan]{sm.current_state.name}[/cyan]\\n"
+                f"Available actions: {sm.current_state.actions_str}\\n"
+                f"Updated: {instance.updated_at.strftime('%Y-%m-%d %H:%M:%S')}",
+                title="Workflow Status",
+                border_style="blue"
+            ))
+
+            # Show context
+            context = sm.get_context_for_injection()
+            console.print("\\n[bold]Current Context:[/bold]")
+            console.print(Panel(context, border_style="green"))
                 
     except FlowGuardError as e:
         console.print(f"[red]Error: {e}[/red]")
         sys.exit(1)
 
 
-@cli.command()
+@cli.command(help="Transition to the next workflow state.")
 @click.argument('action')
 @click.option('--instance-id', '-i', help='Specific instance ID')
 @click.option('--workflow', '-w', help='Workflow name')
 @click.option('--data', '-d', multiple=True, help='Context data as key=value')
 def transition(action: str, instance_id: str = None, workflow: str = None, data: tuple = None):
     """Transition to the next workflow state."""
+    from rich.panel import Panel
+    from .parser import WorkflowParser
+    from .engine import StateMachine
+    from .persistence import StateStore
+
     try:
         store = StateStore()
         
@@ -167,16 +183,15 @@ def transition(action: str, instance_id: str = None, workflow: str = None, data:
             sys.exit(1)
         
         # Load workflow and create state machine
-        workflow_path = Path("workflows") / f"{instance.workflow_name}.yaml"
-        workflow_obj = WorkflowParser.parse_file(workflow_path)
+        workflow_obj = WorkflowParser.load_for_instance(instance)
         sm = StateMachine(workflow_obj, instance)
         
         # Parse context data
         context_update = {}
         if data:
             for item in data:
-                if '=' in item:
-                    key, value = item.split('=', 1)
+                key, sep, value = item.partition('=')
+                if sep:
                     context_update[key] = value
         
         # Attempt transition
@@ -204,10 +219,12 @@ def transition(action: str, instance_id: str = None, workflow: str = None, data:
         sys.exit(1)
 
 
-@cli.command()
+@cli.command(help="Clean up old workflow instances.")
 @click.option('--days', '-d', default=30, help='Delete instances older than N days')
 def cleanup(days: int):
     """Clean up old workflow instances."""
+    from .persistence import StateStore
+
     try:
         store = StateStore()
         deleted = store.cleanup_old_instances(days)
@@ -217,10 +234,12 @@ def cleanup(days: int):
         sys.exit(1)
 
 
-@cli.command()
+@cli.command(help="Validate a workflow YAML file.")
 @click.argument('workflow_file', type=click.Path(exists=True))
 def validate(workflow_file: str):
     """Validate a workflow YAML file."""
+    from .parser import WorkflowParser
+
     try:
         workflow = WorkflowParser.parse_file(workflow_file)
         console.print(f"[green]✓ Workflow '{workflow.name}' is valid[/green]")
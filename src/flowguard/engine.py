@@ -10,14 +10,61 @@ from .exceptions import (
 )
 
 
+_MISSING = object()
+
+_CONVERSIONS = {'s': str, 'r': repr, 'a': ascii}
+
+
+def _render_context(state: State, data: Dict[str, Any]) -> str:
+    """Render a state's required_context from its precompiled fragments.
+
+    Known placeholders are substituted from `data`; unknown ones are left
+    verbatim, matching the historical replace-only-known behavior.
+    """
+    fragments = state.context_fragments
+    if fragments is None:
+        return state.required_context
+
+    parts = []
+    for literal, field_name, format_spec, conversion, placeholder in fragments:
+        if literal:
+            parts.append(literal)
+        if field_name is None:
+            continue
+        value = data.get(field_name, _MISSING)
+        if value is _MISSING:
+            parts.append(placeholder)
+            continue
+        if conversion:
+            converter = _CONVERSIONS.get(conversion)
+            if converter is None:
+                # Unknown conversion: leave the placeholder text as-is
+                parts.append(placeholder)
+                continue
+        else:
+            converter = None
+        try:
+            if converter is not None:
+                value = converter(value)
+            parts.append(format(value, format_spec))
+        except (ValueError, TypeError):
+            # Spec doesn't fit the value (e.g. {pct:d} with a str from
+            # --data): leave the placeholder text as-is rather than raise
+            parts.append(placeholder)
+
+    return "".join(parts)
+
+
 class StateMachine:
     """Manages workflow state transitions and enforcement."""
     
     def __init__(self, workflow: Workflow, instance: Optional[WorkflowInstance] = None):
         """Initialize state machine with a workflow."""
         self.workflow = workflow
+        self._states = {state.id: state for state in workflow.states}
         self.instance = instance or self._create_instance()
         self.prerequisite_checkers: Dict[str, Callable] = {}
+        self._current_state_obj: Optional[State] = None
         
     def _create_instance(self) -> WorkflowInstance:
         """Create a new workflow instance."""
@@ -28,34 +75,73 @@ class StateMachine:
             current_state=self.workflow.initial_state
         )
     
+    def _state_obj(self, state_id: str) -> Optional[State]:
+        """Look up a state by ID."""
+        return self._states.get(state_id)
+
     @property
     def current_state(self) -> State:
         """Get the current state object."""
-        state = self.workflow.get_state(self.instance.current_state)
+        state = self._current_state_obj
+        if state is not None and state.id == self.instance.current_state:
+            return state
+        state = self._states.get(self.instance.current_state)
         if not state:
             raise StateNotFoundError(f"State '{self.instance.current_state}' not found")
+        self._current_state_obj = state
         return state
     
     def register_prerequisite_checker(self, name: str, checker: Callable[[WorkflowInstance], bool]):
         """Register a function to check prerequisites."""
         self.prerequisite_checkers[name] = checker
+
+    def warm_up_checkers(self) -> None:
+        """Pre-trigger compilation of JIT-compiled prerequisite checkers.
+
+        Checkers wrapped by a JIT (e.g. numba dispatchers, which expose
+        ``py_func``) pay their compile cost on the first call; invoking
+        them once with a throwaway instance moves that latency out of the
+        first real transition. Plain Python checkers are skipped.
+        """
+        jit_checkers = [
+            checker for checker in self.prerequisite_checkers.values()
+            if hasattr(checker, 'py_func') or hasattr(checker, '__numba_wrapper__')
+        ]
+        if not jit_checkers:
+            return
+
+        dummy = WorkflowInstance(
+            id="__warmup__",
+            workflow_name=self.workflow.name,
+            current_state=self.workflow.initial_state
+        )
+        for checker in jit_checkers:
+            try:
+                checker(dummy)
+            except Exception:
+                # Warm-up is best-effort; real calls surface real errors
+                pass
     
     def can_transition(self, action: str) -> bool:
         """Check if a transition is allowed from current state."""
-        return action in self.current_state.transitions
+        return action in self.current_state.action_set
     
     def get_available_actions(self) -> List[str]:
         """Get list of available actions from current state."""
-        return list(self.current_state.transitions.keys())
+        return list(self.current_state.action_keys)
     
     def check_prerequisites(self, target_state_id: str) -> List[str]:
         """Check prerequisites for entering a state. Returns list of unmet prerequisites."""
-        target_state = self.workflow.get_state(target_state_id)
+        target_state = self._states.get(target_state_id)
         if not target_state:
             raise StateNotFoundError(f"State '{target_state_id}' not found")
-        
+
+        return self._check_prereqs(target_state)
+
+    def _check_prereqs(self, target_state: State) -> List[str]:
+        """Evaluate a state's prerequisites. Returns list of unmet prerequisites."""
         unmet = []
-        for prereq in target_state.prerequisites:
+        for prereq in target_state.prereq_tuple:
             # Check if we have a registered checker for this prerequisite
             if prereq in self.prerequisite_checkers:
                 if not self.prerequisite_checkers[prereq](self.instance):
@@ -64,7 +150,7 @@ class StateMachine:
                 # If no checker registered, check context data
                 if prereq not in self.instance.context_data:
                     unmet.append(prereq)
-                    
+
         return unmet
     
     def transition(self, action: str, context_update: Optional[Dict[str, Any]] = None) -> State:
@@ -78,14 +164,18 @@ class StateMachine:
         
         # Get target state
         target_state_id = self.current_state.transitions[action]
-        
-        # Check prerequisites
-        unmet_prereqs = self.check_prerequisites(target_state_id)
-        if unmet_prereqs:
-            raise PrerequisiteNotMetError(
-                f"Cannot transition to '{target_state_id}'. "
-                f"Unmet prerequisites: {unmet_prereqs}"
-            )
+        target_state = self._states.get(target_state_id)
+        if not target_state:
+            raise StateNotFoundError(f"State '{target_state_id}' not found")
+
+        # Check prerequisites (skip evaluation entirely when there are none)
+        if target_state.prerequisites:
+            unmet_prereqs = self._check_prereqs(target_state)
+            if unmet_prereqs:
+                raise PrerequisiteNotMetError(
+                    f"Cannot transition to '{target_state_id}'. "
+                    f"Unmet prerequisites: {unmet_prereqs}"
+                )
         
         # Update context if provided
         if context_update:
@@ -106,38 +196,38 @@ class StateMachine:
     
     def get_context_for_injection(self) -> str:
         """Generate context string for injection into AI conversation."""
+        state = self.current_state
         contexts = []
-        
+
         # Add global context if present
         if self.workflow.global_context:
             contexts.append(self.workflow.global_context)
-        
-        # Add current state context
-        state_context = self.current_state.required_context
-        
-        # Replace placeholders with actual values from context_data
-        for key, value in self.instance.context_data.items():
-            placeholder = f"{{{key}}}"
-            state_context = state_context.replace(placeholder, str(value))
-        
-        contexts.append(f"Current workflow state: {self.current_state.name}")
-        contexts.append(state_context)
-        
-        # Add available actions
-        actions = self.get_available_actions()
-        if actions:
-            contexts.append(f"Available actions: {', '.join(actions)}")
-        
-        # Add any unmet prerequisites for next states
-        next_states_info = []
-        for action, target_state_id in self.current_state.transitions.items():
-            unmet = self.check_prerequisites(target_state_id)
-            if unmet:
-                next_states_info.append(f"To {action}: requires {', '.join(unmet)}")
-        
-        if next_states_info:
-            contexts.append("Prerequisites needed: " + "; ".join(next_states_info))
-        
+
+        contexts.append(f"Current workflow state: {state.name}")
+
+        # Add current state context with placeholders filled in from
+        # context_data; unknown placeholders are left as-is
+        contexts.append(_render_context(state, self.instance.context_data))
+
+        if state.transitions:
+            # Add available actions
+            contexts.append("Available actions: " + state.actions_str)
+
+            # Add any unmet prerequisites for next states
+            next_states_info = []
+            for action, target_state_id in state.transitions.items():
+                target_state = self._states.get(target_state_id)
+                if not target_state:
+                    raise StateNotFoundError(f"State '{target_state_id}' not found")
+                if not target_state.prerequisites:
+                    continue
+                unmet = self._check_prereqs(target_state)
+                if unmet:
+                    next_states_info.append(f"To {action}: requires {', '.join(unmet)}")
+
+            if next_states_info:
+                contexts.append("Prerequisites needed: " + "; ".join(next_states_info))
+
         return "\\n".join(contexts)
     
     def get_instance_summary(self) -> Dict[str, Any]:
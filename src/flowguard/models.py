@@ -1,12 +1,20 @@
 """Core models for FlowGuard workflow system."""
 
-from typing import Dict, List, Optional, Any
+from functools import cached_property
+from string import Formatter
+from typing import Dict, FrozenSet, List, Optional, Any, Tuple
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+# Upper bound on retained history entries per instance. Keeps every
+# save() proportional to the cap rather than total transitions ever made.
+MAX_HISTORY_ENTRIES = 1000
 
 
 class Transition(BaseModel):
     """Represents a state transition."""
+    model_config = ConfigDict(frozen=True)
+
     action: str = Field(..., description="Action that triggers this transition")
     target_state: str = Field(..., description="State to transition to")
     prerequisites: List[str] = Field(default_factory=list, description="Required conditions")
@@ -14,6 +22,8 @@ class Transition(BaseModel):
     
 class State(BaseModel):
     """Represents a workflow state."""
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique state identifier")
     name: str = Field(..., description="Human-readable state name")
     description: Optional[str] = Field(None, description="State description")
@@ -21,10 +31,67 @@ class State(BaseModel):
     transitions: Dict[str, str] = Field(default_factory=dict, description="Action -> target state mapping")
     prerequisites: List[str] = Field(default_factory=list, description="Prerequisites to enter this state")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional state data")
-    
+
+    @cached_property
+    def action_keys(self) -> Tuple[str, ...]:
+        """Available action names, computed once per state."""
+        return tuple(self.transitions)
+
+    @cached_property
+    def action_set(self) -> FrozenSet[str]:
+        """Valid action names as a frozenset for membership tests."""
+        return frozenset(self.transitions)
+
+    @cached_property
+    def prereq_tuple(self) -> Tuple[str, ...]:
+        """Prerequisites as a tuple for fast iteration."""
+        return tuple(self.prerequisites)
+
+    @cached_property
+    def actions_str(self) -> str:
+        """Comma-joined action names, computed once per state."""
+        return ', '.join(self.transitions)
+
+    @cached_property
+    def context_fragments(self) -> Optional[Tuple[Tuple[str, Optional[str], str, str, str], ...]]:
+        """Pre-parsed template fragments of required_context.
+
+        Returns None when the context has no placeholders (the common
+        case, letting callers use the string as-is). Otherwise a tuple of
+        (literal, field_name, format_spec, conversion, placeholder_text)
+        fragments, parsed once per State so rendering doesn't re-parse
+        the template on every context injection.
+        """
+        if '{' not in self.required_context:
+            return None
+
+        fragments = []
+        try:
+            parsed = list(Formatter().parse(self.required_context))
+        except ValueError:
+            # Unbalanced braces are legal in freeform context text; treat
+            # the whole string as a literal, as the engine always has
+            return None
+        for literal, field_name, format_spec, conversion in parsed:
+            if field_name is None:
+                fragments.append((literal, None, '', '', ''))
+                continue
+            placeholder = '{' + field_name
+            if conversion:
+                placeholder += '!' + conversion
+            if format_spec:
+                placeholder += ':' + format_spec
+            placeholder += '}'
+            fragments.append((literal, field_name, format_spec or '', conversion or '', placeholder))
+
+        return tuple(fragments)
+
+
 
 class Workflow(BaseModel):
     """Represents a complete workflow definition."""
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Workflow name")
     version: str = Field(default="1.0", description="Workflow version")
     description: Optional[str] = Field(None, description="Workflow description")
@@ -32,13 +99,17 @@ class Workflow(BaseModel):
     states: List[State] = Field(..., description="All states in the workflow")
     global_context: Optional[str] = Field(None, description="Context always injected")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional workflow data")
-    
+
+    _state_index: Optional[Dict[str, State]] = PrivateAttr(default=None)
+
     def get_state(self, state_id: str) -> Optional[State]:
         """Get a state by ID."""
-        for state in self.states:
-            if state.id == state_id:
-                return state
-        return None
+        index = self._state_index
+        if index is None:
+            # Built lazily so model_construct'd workflows get it too
+            index = {state.id: state for state in self.states}
+            self._state_index = index
+        return index.get(state_id)
         
 
 class WorkflowInstance(BaseModel):
@@ -53,12 +124,15 @@ class WorkflowInstance(BaseModel):
     
     def add_history_entry(self, from_state: str, to_state: str, action: str, metadata: Optional[Dict] = None):
         """Add a transition to history."""
+        now = datetime.now()
         entry = {
             "from_state": from_state,
             "to_state": to_state,
             "action": action,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "metadata": metadata or {}
         }
         self.history.append(entry)
-        self.updated_at = datetime.now()
\ No newline at end of file
+        if len(self.history) > MAX_HISTORY_ENTRIES:
+            del self.history[:-MAX_HISTORY_ENTRIES]
+        self.updated_at = now
\ No newline at end of file
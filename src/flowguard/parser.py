@@ -1,9 +1,54 @@
 """YAML workflow parser for FlowGuard."""
 
+import functools
+import os
+import sys
+
 import yaml
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, Union
-from .models import Workflow, State
+from typing import Dict, Any, List, Optional, Tuple, Union
+from .models import Workflow, State, WorkflowInstance
+from .exceptions import WorkflowNotFoundError
+
+try:
+    # Use the libyaml-backed loader/dumper when available (much faster)
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+
+class _InterningLoader(_SafeLoader):
+    """Safe loader that interns string scalars.
+
+    Workflow files repeat the same short strings many times (state IDs
+    as transition targets, action names, prerequisite keys); interning
+    makes every occurrence share one str object.
+    """
+
+
+_InterningLoader.add_constructor(
+    'tag:yaml.org,2002:str',
+    lambda loader, node: sys.intern(loader.construct_scalar(node))
+)
+
+
+@dataclass
+class StateSummary:
+    """Lightweight view of a state, without pydantic validation."""
+    id: str
+    name: str
+    transitions: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class WorkflowSummary:
+    """Lightweight view of a workflow file for display and discovery."""
+    name: str
+    version: str
+    initial_state: str
+    description: Optional[str] = None
+    states: List[StateSummary] = field(default_factory=list)
 
 
 class WorkflowParser:
@@ -11,73 +56,203 @@ class WorkflowParser:
     
     @staticmethod
     def parse_file(filepath: Union[str, Path]) -> Workflow:
-        """Parse a workflow from a YAML file."""
+        """Parse a workflow from a YAML file.
+
+        Results are cached by (absolute path, mtime), so repeated loads of
+        an unchanged file reuse the already-parsed Workflow.
+        """
+        filepath = Path(filepath)
+        if not filepath.exists():
+            raise FileNotFoundError(f"Workflow file not found: {filepath}")
+
+        stat = filepath.stat()
+        return _parse_file_cached(str(filepath.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def find_workflow_file(name: str, directory: Union[str, Path] = "workflows") -> Optional[Path]:
+        """Locate a workflow file by name in a directory.
+
+        The directory is scanned once and indexed by file stem; the index
+        is reused until the directory's mtime changes, so repeated lookups
+        cost a dict probe instead of one stat per candidate path.
+        """
+        directory = Path(directory)
+        try:
+            dir_mtime_ns = directory.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        key = str(directory.resolve())
+        cached = _workflow_dir_index.get(key)
+        if cached is None or cached[0] != dir_mtime_ns:
+            index: Dict[str, Path] = {}
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext not in ('.yaml', '.yml') or not entry.is_file():
+                        continue
+                    # Prefer .yaml when both extensions exist for a stem
+                    if stem not in index or ext == '.yaml':
+                        index[stem] = Path(entry.path)
+            cached = (dir_mtime_ns, index)
+            _workflow_dir_index[key] = cached
+
+        return cached[1].get(name)
+
+    @staticmethod
+    def load_for_instance(instance: WorkflowInstance,
+                          directory: Union[str, Path] = "workflows") -> Workflow:
+        """Load the workflow definition backing an instance.
+
+        Encapsulates the workflows/<name>.yaml convention; lookups go
+        through the directory index and the parse cache, so loading the
+        same workflow for many instances costs one parse.
+        """
+        workflow_path = WorkflowParser.find_workflow_file(instance.workflow_name, directory)
+        if workflow_path is None:
+            raise WorkflowNotFoundError(
+                f"Workflow '{instance.workflow_name}' not found in '{directory}'"
+            )
+        return WorkflowParser.parse_file(workflow_path)
+
+    @staticmethod
+    def parse_file_lite(filepath: Union[str, Path]) -> WorkflowSummary:
+        """Read just the display fields of a workflow file.
+
+        Skips pydantic model construction and workflow validation, so it
+        is suitable for discovery and listing where only names, versions
+        and the transition map are needed. Use parse_file when a full,
+        validated Workflow is required.
+        """
         filepath = Path(filepath)
         if not filepath.exists():
             raise FileNotFoundError(f"Workflow file not found: {filepath}")
-            
+
         with open(filepath, 'r') as f:
-            data = yaml.safe_load(f)
-            
-        return WorkflowParser.parse_dict(data)
-    
+            data = yaml.load(f, Loader=_SafeLoader)
+
+        states = [
+            StateSummary(
+                id=state_data['id'],
+                name=state_data.get('name', state_data['id']),
+                transitions=state_data.get('transitions', {})
+            )
+            for state_data in data.get('states', [])
+        ]
+
+        return WorkflowSummary(
+            name=data['name'],
+            version=data.get('version', '1.0'),
+            initial_state=data.get('initial_state', states[0].id if states else ''),
+            description=data.get('description'),
+            states=states
+        )
+
+    @staticmethod
+    def parse_header(filepath: Union[str, Path]) -> Dict[str, str]:
+        """Read only the top-level scalar fields of a workflow file.
+
+        Walks the raw YAML event stream and collects key/value pairs at
+        the document's top level (name, version, description,
+        initial_state, ...), skipping nested collections like states
+        without constructing them. Values are returned as strings.
+        """
+        filepath = Path(filepath)
+        if not filepath.exists():
+            raise FileNotFoundError(f"Workflow file not found: {filepath}")
+
+        header: Dict[str, str] = {}
+        with open(filepath, 'r') as f:
+            depth = 0
+            key = None
+            for event in yaml.parse(f, Loader=_SafeLoader):
+                if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                    depth += 1
+                    key = None
+                elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                    depth -= 1
+                elif isinstance(event, yaml.ScalarEvent) and depth == 1:
+                    if key is None:
+                        key = event.value
+                    else:
+                        header[key] = event.value
+                        key = None
+
+        return header
+
     @staticmethod
     def parse_string(yaml_string: str) -> Workflow:
         """Parse a workflow from a YAML string."""
-        data = yaml.safe_load(yaml_string)
+        data = yaml.load(yaml_string, Loader=_InterningLoader)
         return WorkflowParser.parse_dict(data)
     
     @staticmethod
     def parse_dict(data: Dict[str, Any]) -> Workflow:
         """Parse a workflow from a dictionary."""
-        # Parse states
-        states = []
-        for state_data in data.get('states', []):
-            state = State(
+        raw_states = data.get('states', [])
+
+        # Validate workflow integrity against the raw data first
+        state_ids = {state_data['id'] for state_data in raw_states}
+
+        initial_state = data.get('initial_state', raw_states[0]['id'] if raw_states else '')
+        if initial_state not in state_ids:
+            raise ValueError(f"Initial state '{initial_state}' not found in workflow")
+
+        for state_data in raw_states:
+            for action, target_state in (state_data.get('transitions') or {}).items():
+                if target_state not in state_ids:
+                    raise ValueError(
+                        f"State '{state_data['id']}' has transition '{action}' to "
+                        f"non-existent state '{target_state}'"
+                    )
+
+        # The values are now trusted, so construct the models via
+        # model_construct and skip pydantic's validation pipeline
+        states = [
+            State.model_construct(
                 id=state_data['id'],
-                name=state_data.get('name', state_data['id']),
+                name=state_data.get('name') or state_data['id'],
                 description=state_data.get('description'),
-                required_context=state_data.get('required_context', ''),
-                transitions=state_data.get('transitions', {}),
-                prerequisites=state_data.get('prerequisites', []),
-                metadata=state_data.get('metadata', {})
+                required_context=state_data.get('required_context') or '',
+                # `or` also normalizes explicit nulls (bare `transitions:`
+                # keys) that model_construct would pass through untouched
+                transitions=state_data.get('transitions') or {},
+                prerequisites=state_data.get('prerequisites') or [],
+                metadata=state_data.get('metadata') or {}
             )
-            states.append(state)
-        
-        # Create workflow
-        workflow = Workflow(
+            for state_data in raw_states
+        ]
+
+        return Workflow.model_construct(
             name=data['name'],
-            version=data.get('version', '1.0'),
+            version=data.get('version') or '1.0',
             description=data.get('description'),
-            initial_state=data.get('initial_state', states[0].id if states else ''),
+            initial_state=initial_state,
             states=states,
             global_context=data.get('global_context'),
-            metadata=data.get('metadata', {})
+            metadata=data.get('metadata') or {}
         )
-        
-        # Validate workflow
-        WorkflowParser._validate_workflow(workflow)
-        
-        return workflow
     
     @staticmethod
-    def _validate_workflow(workflow: Workflow) -> None:
-        """Validate workflow integrity."""
-        state_ids = {state.id for state in workflow.states}
-        
-        # Check initial state exists
-        if workflow.initial_state not in state_ids:
-            raise ValueError(f"Initial state '{workflow.initial_state}' not found in workflow")
-        
-        # Check all transitions point to valid states
-        for state in workflow.states:
-            for action, target_state in state.transitions.items():
-                if target_state not in state_ids:
-                    raise ValueError(
-                        f"State '{state.id}' has transition '{action}' to "
-                        f"non-existent state '{target_state}'"
-                    )
-    
+    def _state_to_dict(state: State) -> Dict[str, Any]:
+        """Convert a State to its YAML-ready dict, omitting empty fields."""
+        state_data = {
+            'id': state.id,
+            'name': state.name,
+            'required_context': state.required_context,
+        }
+
+        if state.description:
+            state_data['description'] = state.description
+        if state.transitions:
+            state_data['transitions'] = state.transitions
+        if state.prerequisites:
+            state_data['prerequisites'] = state.prerequisites
+        if state.metadata:
+            state_data['metadata'] = state.metadata
+
+        return state_data
+
     @staticmethod
     def workflow_to_yaml(workflow: Workflow) -> str:
         """Convert a Workflow object back to YAML."""
@@ -86,31 +261,26 @@ class WorkflowParser:
             'version': workflow.version,
             'description': workflow.description,
             'initial_state': workflow.initial_state,
-            'states': []
+            'states': [WorkflowParser._state_to_dict(state) for state in workflow.states]
         }
-        
+
         if workflow.global_context:
             data['global_context'] = workflow.global_context
-            
+
         if workflow.metadata:
             data['metadata'] = workflow.metadata
-        
-        for state in workflow.states:
-            state_data = {
-                'id': state.id,
-                'name': state.name,
-                'required_context': state.required_context,
-            }
-            
-            if state.description:
-                state_data['description'] = state.description
-            if state.transitions:
-                state_data['transitions'] = state.transitions
-            if state.prerequisites:
-                state_data['prerequisites'] = state.prerequisites
-            if state.metadata:
-                state_data['metadata'] = state.metadata
-                
-            data['states'].append(state_data)
-        
-        return yaml.dump(data, default_flow_style=False, sort_keys=False)
\ No newline at end of file
+
+        return yaml.dump(data, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
+
+
+# Per-directory workflow file index: resolved dir -> (dir mtime_ns, {stem: path})
+_workflow_dir_index: Dict[str, Tuple[int, Dict[str, Path]]] = {}
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_file_cached(path_str: str, mtime_ns: int, size: int) -> Workflow:
+    """Parse a workflow file, keyed on path, mtime and size for cache invalidation."""
+    with open(path_str, 'r') as f:
+        data = yaml.load(f, Loader=_InterningLoader)
+
+    return WorkflowParser.parse_dict(data)
\ No newline at end of file
@@ -1,22 +1,106 @@
 """State persistence for FlowGuard."""
 
+import functools
 import json
+import mmap
 import os
+import sqlite3
 from pathlib import Path
 from typing import Optional, List, Dict
-from datetime import datetime
+from datetime import datetime, timedelta
 from .models import WorkflowInstance
 from .exceptions import PersistenceError
 
+try:
+    # orjson is optional; it decodes JSON much faster than stdlib
+    import orjson
+
+    _loads = orjson.loads
+    _zero_copy = True
+except ImportError:
+    _loads = json.loads
+    _zero_copy = False
+
+# Below one page, mmap setup overhead outweighs the saved copy
+_MMAP_THRESHOLD = mmap.PAGESIZE
+
+
+@functools.lru_cache(maxsize=64)
+def _load_cached(path_str: str, mtime_ns: int, size: int) -> WorkflowInstance:
+    """Decode an instance file, keyed on path/mtime/size for invalidation."""
+    with open(path_str, 'rb') as f:
+        if size > _MMAP_THRESHOLD:
+            # Large histories: decode straight from the page cache
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if _zero_copy:
+                    view = memoryview(mm)
+                    try:
+                        data = _loads(view)
+                    finally:
+                        view.release()
+                else:
+                    data = _loads(bytes(mm))
+        else:
+            data = _loads(f.read())
+
+    # Convert ISO format strings back to datetime
+    data['created_at'] = datetime.fromisoformat(data['created_at'])
+    data['updated_at'] = datetime.fromisoformat(data['updated_at'])
+
+    # The file was produced by our own save(), so skip validation
+    return WorkflowInstance.model_construct(**data)
+
 
 class StateStore:
-    """Handles persistence of workflow state."""
-    
+    """Handles persistence of workflow state.
+
+    Instances are stored as one JSON file each, with a small SQLite index
+    of summary fields (id, workflow_name, current_state, updated_at) so
+    listing and cleanup don't have to open and decode every file.
+    """
+
     def __init__(self, storage_dir: Optional[Path] = None):
         """Initialize state store."""
         self.storage_dir = storage_dir or Path.home() / ".flowguard-state"
         self.storage_dir.mkdir(exist_ok=True)
-        
+        self._db = sqlite3.connect(self.storage_dir / "index.sqlite3")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS instances ("
+            "id TEXT PRIMARY KEY, "
+            "workflow_name TEXT NOT NULL, "
+            "current_state TEXT NOT NULL, "
+            "updated_at TEXT NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_instances_updated_at "
+            "ON instances(updated_at)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_instances_workflow "
+            "ON instances(workflow_name, updated_at)"
+        )
+        if not self._db.execute("SELECT 1 FROM instances LIMIT 1").fetchone():
+            self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Populate the index from existing JSON files (one-time migration)."""
+        rows = []
+        for file_path in self.storage_dir.glob("*.json"):
+            try:
+                with open(file_path, 'rb') as f:
+                    data = _loads(f.read())
+                rows.append((data["id"], data["workflow_name"],
+                             data["current_state"], data["updated_at"]))
+            except Exception:
+                # Skip corrupted files
+                continue
+
+        if rows:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO instances VALUES (?, ?, ?, ?)", rows
+            )
+            self._db.commit()
+
     def _get_instance_path(self, instance_id: str) -> Path:
         """Get the file path for an instance."""
         return self.storage_dir / f"{instance_id}.json"
@@ -25,35 +109,46 @@ class StateStore:
         """Save a workflow instance to disk."""
         try:
             instance_path = self._get_instance_path(instance.id)
-            
-            # Convert to dict and handle datetime serialization
-            data = instance.model_dump()
-            data['created_at'] = instance.created_at.isoformat()
-            data['updated_at'] = instance.updated_at.isoformat()
-            
-            with open(instance_path, 'w') as f:
-                json.dump(data, f, indent=2)
-                
+
+            # pydantic-core serializes straight to JSON (datetimes become
+            # ISO strings) without an intermediate dict
+            payload = instance.model_dump_json(indent=2).encode()
+
+            # Write to a sibling temp file and swap it in atomically, so
+            # a crash mid-write can't corrupt the instance
+            tmp_path = instance_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, instance_path)
+
+            self._db.execute(
+                "INSERT OR REPLACE INTO instances VALUES (?, ?, ?, ?)",
+                (instance.id, instance.workflow_name,
+                 instance.current_state, instance.updated_at.isoformat())
+            )
+            self._db.commit()
+
         except Exception as e:
             raise PersistenceError(f"Failed to save instance: {e}")
     
     def load(self, instance_id: str) -> Optional[WorkflowInstance]:
-        """Load a workflow instance from disk."""
+        """Load a workflow instance from disk.
+
+        Unchanged files are served from an in-process cache keyed on
+        (path, mtime, size); any save() bumps the mtime and invalidates
+        the cached entry automatically. Callers get a deep copy, so
+        mutating a loaded instance never leaks into later loads.
+        """
         try:
             instance_path = self._get_instance_path(instance_id)
-            
+
             if not instance_path.exists():
                 return None
-                
-            with open(instance_path, 'r') as f:
-                data = json.load(f)
-            
-            # Convert ISO format strings back to datetime
-            data['created_at'] = datetime.fromisoformat(data['created_at'])
-            data['updated_at'] = datetime.fromisoformat(data['updated_at'])
-            
-            return WorkflowInstance(**data)
-            
+
+            stat = instance_path.stat()
+            cached = _load_cached(str(instance_path), stat.st_mtime_ns, stat.st_size)
+            return cached.model_copy(deep=True)
+
         except Exception as e:
             raise PersistenceError(f"Failed to load instance: {e}")
     
@@ -62,65 +157,74 @@ class StateStore:
         try:
             instance_path = self._get_instance_path(instance_id)
             
+            self._db.execute("DELETE FROM instances WHERE id = ?", (instance_id,))
+            self._db.commit()
+
             if instance_path.exists():
                 instance_path.unlink()
                 return True
             return False
-            
+
         except Exception as e:
             raise PersistenceError(f"Failed to delete instance: {e}")
-    
-    def list_instances(self) -> List[Dict[str, str]]:
-        """List all stored instances."""
-        instances = []
-        
-        for file_path in self.storage_dir.glob("*.json"):
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    instances.append({
-                        "id": data["id"],
-                        "workflow_name": data["workflow_name"],
-                        "current_state": data["current_state"],
-                        "updated_at": data["updated_at"]
-                    })
-            except Exception:
-                # Skip corrupted files
-                continue
-                
-        # Sort by updated time, most recent first
-        instances.sort(key=lambda x: x["updated_at"], reverse=True)
-        return instances
+
+    def list_instances(self, limit: Optional[int] = None) -> List[Dict[str, str]]:
+        """List stored instances, most recently updated first."""
+        query = (
+            "SELECT id, workflow_name, current_state, updated_at "
+            "FROM instances ORDER BY updated_at DESC"
+        )
+        if limit is not None:
+            rows = self._db.execute(query + " LIMIT ?", (limit,))
+        else:
+            rows = self._db.execute(query)
+
+        return [
+            {
+                "id": row[0],
+                "workflow_name": row[1],
+                "current_state": row[2],
+                "updated_at": row[3]
+            }
+            for row in rows
+        ]
     
     def get_active_instance(self, workflow_name: str) -> Optional[WorkflowInstance]:
         """Get the most recently updated instance for a workflow."""
-        instances = self.list_instances()
-        
-        for instance_info in instances:
-            if instance_info["workflow_name"] == workflow_name:
-                return self.load(instance_info["id"])
-                
-        return None
+        row = self._db.execute(
+            "SELECT id FROM instances WHERE workflow_name = ? "
+            "ORDER BY updated_at DESC LIMIT 1",
+            (workflow_name,)
+        ).fetchone()
+
+        if row is None:
+            return None
+        return self.load(row[0])
     
     def cleanup_old_instances(self, days: int = 30) -> int:
         """Remove instances older than specified days. Returns count of deleted instances."""
-        from datetime import timedelta
-        
-        cutoff = datetime.now() - timedelta(days=days)
-        deleted = 0
-        
-        for file_path in self.storage_dir.glob("*.json"):
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+
+        # ISO timestamps sort lexicographically, so the index answers this
+        # without decoding any instance files
+        stale = [
+            row[0] for row in self._db.execute(
+                "SELECT id FROM instances WHERE updated_at < ?", (cutoff,)
+            )
+        ]
+
+        for instance_id in stale:
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    updated_at = datetime.fromisoformat(data["updated_at"])
-                    
-                if updated_at < cutoff:
-                    file_path.unlink()
-                    deleted += 1
-                    
-            except Exception:
-                # Skip files we can't process
-                continue
-                
-        return deleted
\ No newline at end of file
+                self._get_instance_path(instance_id).unlink()
+            except OSError:
+                # File already gone; still drop the index entry
+                pass
+
+        if stale:
+            self._db.executemany(
+                "DELETE FROM instances WHERE id = ?",
+                [(instance_id,) for instance_id in stale]
+            )
+            self._db.commit()
+
+        return len(stale)
\ No newline at end of file
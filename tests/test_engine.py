@@ -3,7 +3,11 @@
 import pytest
 from flowguard.models import State, Workflow
 from flowguard.engine import StateMachine
-from flowguard.exceptions import TransitionNotAllowedError, PrerequisiteNotMetError
+from flowguard.exceptions import (
+    StateNotFoundError,
+    TransitionNotAllowedError,
+    PrerequisiteNotMetError
+)
 
 
 def create_test_workflow():
@@ -78,6 +82,26 @@ def test_invalid_transition():
         sm.transition("invalid_action")
 
 
+def test_transition_to_missing_state():
+    """Test transition targeting an undefined state raises FlowGuard error."""
+    workflow = Workflow(
+        name="test_workflow",
+        initial_state="start",
+        states=[
+            State(
+                id="start",
+                name="Start",
+                required_context="Starting state",
+                transitions={"go": "nowhere"}
+            )
+        ]
+    )
+    sm = StateMachine(workflow)
+
+    with pytest.raises(StateNotFoundError):
+        sm.transition("go")
+
+
 def test_prerequisite_checking():
     """Test prerequisite enforcement."""
     workflow = create_test_workflow()
@@ -104,6 +128,48 @@ def test_context_injection():
     assert "Available actions: go" in context
 
 
+def test_context_with_unbalanced_braces():
+    """Test context with unbalanced braces is passed through untouched."""
+    workflow = Workflow(
+        name="test_workflow",
+        initial_state="only",
+        states=[
+            State(
+                id="only",
+                name="Only",
+                required_context="Output JSON like { and fill in"
+            )
+        ]
+    )
+    sm = StateMachine(workflow)
+    sm.instance.context_data["data"] = "unused"
+
+    context = sm.get_context_for_injection()
+    assert "Output JSON like { and fill in" in context
+
+
+def test_context_with_mismatched_format_spec():
+    """Test a spec that doesn't fit the value leaves the placeholder as-is."""
+    workflow = Workflow(
+        name="test_workflow",
+        initial_state="only",
+        states=[
+            State(
+                id="only",
+                name="Only",
+                required_context="Progress: {pct:d} of {total}"
+            )
+        ]
+    )
+    sm = StateMachine(workflow)
+    # CLI --data values are always strings, which {pct:d} can't format
+    sm.instance.context_data["pct"] = "50"
+    sm.instance.context_data["total"] = "100"
+
+    context = sm.get_context_for_injection()
+    assert "Progress: {pct:d} of 100" in context
+
+
 def test_context_with_placeholders():
     """Test context with placeholder replacement."""
     workflow = create_test_workflow()
@@ -0,0 +1,132 @@
+"""Tests for the workflow parser."""
+
+import pytest
+from flowguard.models import WorkflowInstance
+from flowguard.parser import WorkflowParser
+from flowguard.exceptions import WorkflowNotFoundError
+
+SIMPLE_YAML = """
+name: sample
+initial_state: start
+states:
+  - id: start
+    name: Start
+    required_context: "Starting"
+    transitions:
+      go: end
+  - id: end
+    name: End
+    required_context: "Done"
+"""
+
+
+def write_workflow(directory, name="sample", content=SIMPLE_YAML):
+    """Write a workflow YAML file and return its path."""
+    path = directory / f"{name}.yaml"
+    path.write_text(content)
+    return path
+
+
+def test_parse_file(tmp_path):
+    """Test parsing a workflow from a file."""
+    path = write_workflow(tmp_path)
+    workflow = WorkflowParser.parse_file(path)
+
+    assert workflow.name == "sample"
+    assert workflow.initial_state == "start"
+    assert len(workflow.states) == 2
+
+
+def test_parse_file_missing(tmp_path):
+    """Test parsing a nonexistent file raises."""
+    with pytest.raises(FileNotFoundError):
+        WorkflowParser.parse_file(tmp_path / "missing.yaml")
+
+
+def test_parse_file_cached_until_modified(tmp_path):
+    """Test repeated parses reuse the cached Workflow until the file changes."""
+    import os
+
+    path = write_workflow(tmp_path)
+    first = WorkflowParser.parse_file(path)
+    assert WorkflowParser.parse_file(path) is first
+
+    write_workflow(tmp_path, content=SIMPLE_YAML.replace("sample", "renamed"))
+    os.utime(path, ns=(0, 0))  # Force a distinct mtime
+    assert WorkflowParser.parse_file(path).name == "renamed"
+
+
+def test_parse_empty_collection_keys():
+    """Test bare transitions:/prerequisites: keys parse as empty, not None."""
+    workflow = WorkflowParser.parse_string(
+        SIMPLE_YAML.replace(
+            "  - id: end\n", "  - id: end\n    transitions:\n    prerequisites:\n"
+        )
+    )
+
+    end = workflow.get_state("end")
+    assert end.transitions == {}
+    assert end.prerequisites == []
+    assert end.metadata == {}
+
+
+def test_invalid_transition_target():
+    """Test validation rejects transitions to unknown states."""
+    with pytest.raises(ValueError):
+        WorkflowParser.parse_string(SIMPLE_YAML.replace("go: end", "go: nowhere"))
+
+
+def test_find_workflow_file(tmp_path):
+    """Test directory-index workflow lookup."""
+    path = write_workflow(tmp_path)
+
+    assert WorkflowParser.find_workflow_file("sample", tmp_path) == path
+    assert WorkflowParser.find_workflow_file("missing", tmp_path) is None
+    assert WorkflowParser.find_workflow_file("sample", tmp_path / "nope") is None
+
+
+def test_load_for_instance(tmp_path):
+    """Test loading the workflow behind an instance."""
+    write_workflow(tmp_path)
+    instance = WorkflowInstance(
+        id="inst-1", workflow_name="sample", current_state="start"
+    )
+
+    workflow = WorkflowParser.load_for_instance(instance, tmp_path)
+    assert workflow.name == "sample"
+
+    instance.workflow_name = "missing"
+    with pytest.raises(WorkflowNotFoundError):
+        WorkflowParser.load_for_instance(instance, tmp_path)
+
+
+def test_parse_file_lite(tmp_path):
+    """Test the lightweight summary parse."""
+    path = write_workflow(tmp_path)
+    summary = WorkflowParser.parse_file_lite(path)
+
+    assert summary.name == "sample"
+    assert summary.version == "1.0"
+    assert summary.initial_state == "start"
+    assert [s.id for s in summary.states] == ["start", "end"]
+    assert summary.states[0].transitions == {"go": "end"}
+
+
+def test_parse_header(tmp_path):
+    """Test reading only top-level scalar fields."""
+    path = write_workflow(tmp_path)
+    header = WorkflowParser.parse_header(path)
+
+    assert header["name"] == "sample"
+    assert header["initial_state"] == "start"
+    assert "states" not in header
+
+
+def test_workflow_to_yaml_roundtrip():
+    """Test serializing a workflow back to YAML."""
+    workflow = WorkflowParser.parse_string(SIMPLE_YAML)
+    dumped = WorkflowParser.workflow_to_yaml(workflow)
+
+    reparsed = WorkflowParser.parse_string(dumped)
+    assert reparsed.name == workflow.name
+    assert [s.id for s in reparsed.states] == [s.id for s in workflow.states]
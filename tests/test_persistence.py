@@ -0,0 +1,118 @@
+"""Tests for state persistence."""
+
+import time
+
+import pytest
+from flowguard.models import WorkflowInstance
+from flowguard.persistence import StateStore
+
+
+def make_instance(instance_id: str, workflow_name: str = "test_workflow") -> WorkflowInstance:
+    """Create a simple instance for persistence tests."""
+    return WorkflowInstance(
+        id=instance_id,
+        workflow_name=workflow_name,
+        current_state="start"
+    )
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    """Test saving and loading an instance."""
+    store = StateStore(storage_dir=tmp_path)
+    instance = make_instance("inst-1")
+    instance.context_data["key"] = "value"
+
+    store.save(instance)
+    loaded = store.load("inst-1")
+
+    assert loaded is not None
+    assert loaded.id == "inst-1"
+    assert loaded.workflow_name == "test_workflow"
+    assert loaded.context_data["key"] == "value"
+
+
+def test_load_missing_returns_none(tmp_path):
+    """Test loading a nonexistent instance."""
+    store = StateStore(storage_dir=tmp_path)
+    assert store.load("missing") is None
+
+
+def test_list_instances_sorted_and_limited(tmp_path):
+    """Test listing instances, most recent first, with a limit."""
+    store = StateStore(storage_dir=tmp_path)
+    for i in range(3):
+        store.save(make_instance(f"inst-{i}"))
+        time.sleep(0.01)  # Ensure distinct updated_at timestamps
+
+    instances = store.list_instances()
+    assert [info["id"] for info in instances] == ["inst-2", "inst-1", "inst-0"]
+
+    limited = store.list_instances(limit=2)
+    assert [info["id"] for info in limited] == ["inst-2", "inst-1"]
+
+
+def test_load_reflects_disk_not_unsaved_mutations(tmp_path):
+    """Test that mutating a loaded instance doesn't leak into later loads."""
+    store = StateStore(storage_dir=tmp_path)
+    store.save(make_instance("inst-1"))
+
+    first = store.load("inst-1")
+    first.current_state = "elsewhere"
+    first.context_data["dirty"] = True
+
+    second = store.load("inst-1")
+    assert second.current_state == "start"
+    assert "dirty" not in second.context_data
+
+
+def test_delete_instance(tmp_path):
+    """Test deleting an instance removes file and listing."""
+    store = StateStore(storage_dir=tmp_path)
+    store.save(make_instance("inst-1"))
+
+    assert store.delete("inst-1") is True
+    assert store.load("inst-1") is None
+    assert store.list_instances() == []
+    assert store.delete("inst-1") is False
+
+
+def test_get_active_instance(tmp_path):
+    """Test finding the most recent instance for a workflow."""
+    store = StateStore(storage_dir=tmp_path)
+    store.save(make_instance("inst-a", workflow_name="alpha"))
+    time.sleep(0.01)
+    store.save(make_instance("inst-b", workflow_name="beta"))
+    time.sleep(0.01)
+    store.save(make_instance("inst-c", workflow_name="alpha"))
+
+    active = store.get_active_instance("alpha")
+    assert active is not None
+    assert active.id == "inst-c"
+
+    assert store.get_active_instance("unknown") is None
+
+
+def test_cleanup_old_instances(tmp_path):
+    """Test cleanup removes only old instances."""
+    store = StateStore(storage_dir=tmp_path)
+    store.save(make_instance("inst-fresh"))
+
+    deleted = store.cleanup_old_instances(days=30)
+    assert deleted == 0
+    assert store.load("inst-fresh") is not None
+
+    # Everything is newer than "0 days ago", so it all gets removed
+    deleted = store.cleanup_old_instances(days=0)
+    assert deleted == 1
+    assert store.load("inst-fresh") is None
+
+
+def test_index_rebuilt_from_existing_files(tmp_path):
+    """Test that a fresh store picks up instances saved by an earlier one."""
+    store = StateStore(storage_dir=tmp_path)
+    store.save(make_instance("inst-1"))
+
+    (tmp_path / "index.sqlite3").unlink()
+
+    reopened = StateStore(storage_dir=tmp_path)
+    assert [info["id"] for info in reopened.list_instances()] == ["inst-1"]